@@ -1,17 +1,102 @@
 # coding:UTF-8
+import struct
 import threading
 import time
+from collections import namedtuple
 import serial
 from serial import SerialException
 
+try:
+    import crcmod.predefined
+except ImportError:
+    crcmod = None
+
+
+# region   Calculate CRC
+# Lookup tables, stored as raw bytes (indexing returns an int)
+_CRC_HI = bytes([
+    0x00, 0xC1, 0x81, 0x40, 0x01, 0xC0, 0x80, 0x41, 0x01, 0xC0, 0x80, 0x41, 0x00, 0xC1, 0x81,
+    0x40, 0x01, 0xC0, 0x80, 0x41, 0x00, 0xC1, 0x81, 0x40, 0x00, 0xC1, 0x81, 0x40, 0x01, 0xC0,
+    0x80, 0x41, 0x01, 0xC0, 0x80, 0x41, 0x00, 0xC1, 0x81, 0x40, 0x00, 0xC1, 0x81, 0x40, 0x01,
+    0xC0, 0x80, 0x41, 0x00, 0xC1, 0x81, 0x40, 0x01, 0xC0, 0x80, 0x41, 0x01, 0xC0, 0x80, 0x41,
+    0x00, 0xC1, 0x81, 0x40, 0x01, 0xC0, 0x80, 0x41, 0x00, 0xC1, 0x81, 0x40, 0x00, 0xC1, 0x81,
+    0x40, 0x01, 0xC0, 0x80, 0x41, 0x00, 0xC1, 0x81, 0x40, 0x01, 0xC0, 0x80, 0x41, 0x01, 0xC0,
+    0x80, 0x41, 0x00, 0xC1, 0x81, 0x40, 0x00, 0xC1, 0x81, 0x40, 0x01, 0xC0, 0x80, 0x41, 0x01,
+    0xC0, 0x80, 0x41, 0x00, 0xC1, 0x81, 0x40, 0x01, 0xC0, 0x80, 0x41, 0x00, 0xC1, 0x81, 0x40,
+    0x00, 0xC1, 0x81, 0x40, 0x01, 0xC0, 0x80, 0x41, 0x01, 0xC0, 0x80, 0x41, 0x00, 0xC1, 0x81,
+    0x40, 0x00, 0xC1, 0x81, 0x40, 0x01, 0xC0, 0x80, 0x41, 0x00, 0xC1, 0x81, 0x40, 0x01, 0xC0,
+    0x80, 0x41, 0x01, 0xC0, 0x80, 0x41, 0x00, 0xC1, 0x81, 0x40, 0x00, 0xC1, 0x81, 0x40, 0x01,
+    0xC0, 0x80, 0x41, 0x01, 0xC0, 0x80, 0x41, 0x00, 0xC1, 0x81, 0x40, 0x01, 0xC0, 0x80, 0x41,
+    0x00, 0xC1, 0x81, 0x40, 0x00, 0xC1, 0x81, 0x40, 0x01, 0xC0, 0x80, 0x41, 0x00, 0xC1, 0x81,
+    0x40, 0x01, 0xC0, 0x80, 0x41, 0x01, 0xC0, 0x80, 0x41, 0x00, 0xC1, 0x81, 0x40, 0x01, 0xC0,
+    0x80, 0x41, 0x00, 0xC1, 0x81, 0x40, 0x00, 0xC1, 0x81, 0x40, 0x01, 0xC0, 0x80, 0x41, 0x01,
+    0xC0, 0x80, 0x41, 0x00, 0xC1, 0x81, 0x40, 0x00, 0xC1, 0x81, 0x40, 0x01, 0xC0, 0x80, 0x41,
+    0x00, 0xC1, 0x81, 0x40, 0x01, 0xC0, 0x80, 0x41, 0x01, 0xC0, 0x80, 0x41, 0x00, 0xC1, 0x81,
+    0x40])
+
+_CRC_LO = bytes([
+    0x00, 0xC0, 0xC1, 0x01, 0xC3, 0x03, 0x02, 0xC2, 0xC6, 0x06, 0x07, 0xC7, 0x05, 0xC5, 0xC4,
+    0x04, 0xCC, 0x0C, 0x0D, 0xCD, 0x0F, 0xCF, 0xCE, 0x0E, 0x0A, 0xCA, 0xCB, 0x0B, 0xC9, 0x09,
+    0x08, 0xC8, 0xD8, 0x18, 0x19, 0xD9, 0x1B, 0xDB, 0xDA, 0x1A, 0x1E, 0xDE, 0xDF, 0x1F, 0xDD,
+    0x1D, 0x1C, 0xDC, 0x14, 0xD4, 0xD5, 0x15, 0xD7, 0x17, 0x16, 0xD6, 0xD2, 0x12, 0x13, 0xD3,
+    0x11, 0xD1, 0xD0, 0x10, 0xF0, 0x30, 0x31, 0xF1, 0x33, 0xF3, 0xF2, 0x32, 0x36, 0xF6, 0xF7,
+    0x37, 0xF5, 0x35, 0x34, 0xF4, 0x3C, 0xFC, 0xFD, 0x3D, 0xFF, 0x3F, 0x3E, 0xFE, 0xFA, 0x3A,
+    0x3B, 0xFB, 0x39, 0xF9, 0xF8, 0x38, 0x28, 0xE8, 0xE9, 0x29, 0xEB, 0x2B, 0x2A, 0xEA, 0xEE,
+    0x2E, 0x2F, 0xEF, 0x2D, 0xED, 0xEC, 0x2C, 0xE4, 0x24, 0x25, 0xE5, 0x27, 0xE7, 0xE6, 0x26,
+    0x22, 0xE2, 0xE3, 0x23, 0xE1, 0x21, 0x20, 0xE0, 0xA0, 0x60, 0x61, 0xA1, 0x63, 0xA3, 0xA2,
+    0x62, 0x66, 0xA6, 0xA7, 0x67, 0xA5, 0x65, 0x64, 0xA4, 0x6C, 0xAC, 0xAD, 0x6D, 0xAF, 0x6F,
+    0x6E, 0xAE, 0xAA, 0x6A, 0x6B, 0xAB, 0x69, 0xA9, 0xA8, 0x68, 0x78, 0xB8, 0xB9, 0x79, 0xBB,
+    0x7B, 0x7A, 0xBA, 0xBE, 0x7E, 0x7F, 0xBF, 0x7D, 0xBD, 0xBC, 0x7C, 0xB4, 0x74, 0x75, 0xB5,
+    0x77, 0xB7, 0xB6, 0x76, 0x72, 0xB2, 0xB3, 0x73, 0xB1, 0x71, 0x70, 0xB0, 0x50, 0x90, 0x91,
+    0x51, 0x93, 0x53, 0x52, 0x92, 0x96, 0x56, 0x57, 0x97, 0x55, 0x95, 0x94, 0x54, 0x9C, 0x5C,
+    0x5D, 0x9D, 0x5F, 0x9F, 0x9E, 0x5E, 0x5A, 0x9A, 0x9B, 0x5B, 0x99, 0x59, 0x58, 0x98, 0x88,
+    0x48, 0x49, 0x89, 0x4B, 0x8B, 0x8A, 0x4A, 0x4E, 0x8E, 0x8F, 0x4F, 0x8D, 0x4D, 0x4C, 0x8C,
+    0x44, 0x84, 0x85, 0x45, 0x87, 0x47, 0x46, 0x86, 0x82, 0x42, 0x43, 0x83, 0x41, 0x81, 0x80,
+    0x40])
+
+
+# Table driven CRC-16/Modbus, used when crcmod is not installed
+def _modbus_crc_py(data):
+    hi = _CRC_HI
+    lo = _CRC_LO
+    tempH = 0xff  # High CRC byte initialization
+    tempL = 0xff  # Low CRC byte initialization
+    for val in data:
+        tempIndex = (tempH ^ val) & 0xff
+        tempH = (tempL ^ hi[tempIndex]) & 0xff
+        tempL = lo[tempIndex]
+    # Standard CRC-16/Modbus value (its low byte is sent first)
+    return (tempL << 8) | tempH
+
+
+# CRC-16/Modbus of a bytes object, in C when crcmod is available
+_modbus_crc = crcmod.predefined.mkCrcFun('modbus') if crcmod is not None else _modbus_crc_py
+
+# endregion  Calculate CRC
+
+
+# Keys of the 24-byte data block, in register order
+_KEYS24 = ("AccX", "AccY", "AccZ", "AsX", "AsY", "AsZ", "HX", "HY", "HZ", "AngX", "AngY", "AngZ")
+
+# Values of one 24-byte data block, passed to the data callback
+SensorData = namedtuple('SensorData', _KEYS24)
+
+# Scale factors of the 24-byte data block (acceleration, angular velocity, magnetic field, angle)
+_SCALE24 = (16 / 32768,) * 3 + (2000 / 32768,) * 3 + (13 / 1000,) * 3 + (180 / 32768,) * 3
+
+# 24-byte data package: 3 header bytes, 12 big-endian signed shorts, 2 CRC bytes
+_FRAME24 = struct.Struct('>3x12h2x')
+
 
 # Serial Port Configuration
 class SerialConfig:
-    # Serial port number
-    portName = ''
+    __slots__ = ('portName', 'baud')
 
-    # Baud rate
-    baud = 9600
+    def __init__(self, portName='', baud=9600):
+        # Serial port number
+        self.portName = portName
+        # Baud rate
+        self.baud = baud
 
 
 # Device instance
@@ -21,12 +106,6 @@ class DeviceModel:
     # Device name
     deviceName = "My Device"
 
-    # Device Modbus ID list
-    addrLis = []
-
-    # Device data dictionary
-    deviceData = {}
-
     # Is the device open
     isOpen = False
 
@@ -36,87 +115,37 @@ class DeviceModel:
     # Serial port
     serialPort = None
 
-    # Serial port configuration
-    serialConfig = SerialConfig()
-
-    # Temporary array
-    TempBytes = []
-
-    # Start register
-    statReg = None
-
     # endregion
 
-    # region   Calculate CRC
-    auchCRCHi = [
-        0x00, 0xC1, 0x81, 0x40, 0x01, 0xC0, 0x80, 0x41, 0x01, 0xC0, 0x80, 0x41, 0x00, 0xC1, 0x81,
-        0x40, 0x01, 0xC0, 0x80, 0x41, 0x00, 0xC1, 0x81, 0x40, 0x00, 0xC1, 0x81, 0x40, 0x01, 0xC0,
-        0x80, 0x41, 0x01, 0xC0, 0x80, 0x41, 0x00, 0xC1, 0x81, 0x40, 0x00, 0xC1, 0x81, 0x40, 0x01,
-        0xC0, 0x80, 0x41, 0x00, 0xC1, 0x81, 0x40, 0x01, 0xC0, 0x80, 0x41, 0x01, 0xC0, 0x80, 0x41,
-        0x00, 0xC1, 0x81, 0x40, 0x01, 0xC0, 0x80, 0x41, 0x00, 0xC1, 0x81, 0x40, 0x00, 0xC1, 0x81,
-        0x40, 0x01, 0xC0, 0x80, 0x41, 0x00, 0xC1, 0x81, 0x40, 0x01, 0xC0, 0x80, 0x41, 0x01, 0xC0,
-        0x80, 0x41, 0x00, 0xC1, 0x81, 0x40, 0x00, 0xC1, 0x81, 0x40, 0x01, 0xC0, 0x80, 0x41, 0x01,
-        0xC0, 0x80, 0x41, 0x00, 0xC1, 0x81, 0x40, 0x01, 0xC0, 0x80, 0x41, 0x00, 0xC1, 0x81, 0x40,
-        0x00, 0xC1, 0x81, 0x40, 0x01, 0xC0, 0x80, 0x41, 0x01, 0xC0, 0x80, 0x41, 0x00, 0xC1, 0x81,
-        0x40, 0x00, 0xC1, 0x81, 0x40, 0x01, 0xC0, 0x80, 0x41, 0x00, 0xC1, 0x81, 0x40, 0x01, 0xC0,
-        0x80, 0x41, 0x01, 0xC0, 0x80, 0x41, 0x00, 0xC1, 0x81, 0x40, 0x00, 0xC1, 0x81, 0x40, 0x01,
-        0xC0, 0x80, 0x41, 0x01, 0xC0, 0x80, 0x41, 0x00, 0xC1, 0x81, 0x40, 0x01, 0xC0, 0x80, 0x41,
-        0x00, 0xC1, 0x81, 0x40, 0x00, 0xC1, 0x81, 0x40, 0x01, 0xC0, 0x80, 0x41, 0x00, 0xC1, 0x81,
-        0x40, 0x01, 0xC0, 0x80, 0x41, 0x01, 0xC0, 0x80, 0x41, 0x00, 0xC1, 0x81, 0x40, 0x01, 0xC0,
-        0x80, 0x41, 0x00, 0xC1, 0x81, 0x40, 0x00, 0xC1, 0x81, 0x40, 0x01, 0xC0, 0x80, 0x41, 0x01,
-        0xC0, 0x80, 0x41, 0x00, 0xC1, 0x81, 0x40, 0x00, 0xC1, 0x81, 0x40, 0x01, 0xC0, 0x80, 0x41,
-        0x00, 0xC1, 0x81, 0x40, 0x01, 0xC0, 0x80, 0x41, 0x01, 0xC0, 0x80, 0x41, 0x00, 0xC1, 0x81,
-        0x40]
-
-    auchCRCLo = [
-        0x00, 0xC0, 0xC1, 0x01, 0xC3, 0x03, 0x02, 0xC2, 0xC6, 0x06, 0x07, 0xC7, 0x05, 0xC5, 0xC4,
-        0x04, 0xCC, 0x0C, 0x0D, 0xCD, 0x0F, 0xCF, 0xCE, 0x0E, 0x0A, 0xCA, 0xCB, 0x0B, 0xC9, 0x09,
-        0x08, 0xC8, 0xD8, 0x18, 0x19, 0xD9, 0x1B, 0xDB, 0xDA, 0x1A, 0x1E, 0xDE, 0xDF, 0x1F, 0xDD,
-        0x1D, 0x1C, 0xDC, 0x14, 0xD4, 0xD5, 0x15, 0xD7, 0x17, 0x16, 0xD6, 0xD2, 0x12, 0x13, 0xD3,
-        0x11, 0xD1, 0xD0, 0x10, 0xF0, 0x30, 0x31, 0xF1, 0x33, 0xF3, 0xF2, 0x32, 0x36, 0xF6, 0xF7,
-        0x37, 0xF5, 0x35, 0x34, 0xF4, 0x3C, 0xFC, 0xFD, 0x3D, 0xFF, 0x3F, 0x3E, 0xFE, 0xFA, 0x3A,
-        0x3B, 0xFB, 0x39, 0xF9, 0xF8, 0x38, 0x28, 0xE8, 0xE9, 0x29, 0xEB, 0x2B, 0x2A, 0xEA, 0xEE,
-        0x2E, 0x2F, 0xEF, 0x2D, 0xED, 0xEC, 0x2C, 0xE4, 0x24, 0x25, 0xE5, 0x27, 0xE7, 0xE6, 0x26,
-        0x22, 0xE2, 0xE3, 0x23, 0xE1, 0x21, 0x20, 0xE0, 0xA0, 0x60, 0x61, 0xA1, 0x63, 0xA3, 0xA2,
-        0x62, 0x66, 0xA6, 0xA7, 0x67, 0xA5, 0x65, 0x64, 0xA4, 0x6C, 0xAC, 0xAD, 0x6D, 0xAF, 0x6F,
-        0x6E, 0xAE, 0xAA, 0x6A, 0x6B, 0xAB, 0x69, 0xA9, 0xA8, 0x68, 0x78, 0xB8, 0xB9, 0x79, 0xBB,
-        0x7B, 0x7A, 0xBA, 0xBE, 0x7E, 0x7F, 0xBF, 0x7D, 0xBD, 0xBC, 0x7C, 0xB4, 0x74, 0x75, 0xB5,
-        0x77, 0xB7, 0xB6, 0x76, 0x72, 0xB2, 0xB3, 0x73, 0xB1, 0x71, 0x70, 0xB0, 0x50, 0x90, 0x91,
-        0x51, 0x93, 0x53, 0x52, 0x92, 0x96, 0x56, 0x57, 0x97, 0x55, 0x95, 0x94, 0x54, 0x9C, 0x5C,
-        0x5D, 0x9D, 0x5F, 0x9F, 0x9E, 0x5E, 0x5A, 0x9A, 0x9B, 0x5B, 0x99, 0x59, 0x58, 0x98, 0x88,
-        0x48, 0x49, 0x89, 0x4B, 0x8B, 0x8A, 0x4A, 0x4E, 0x8E, 0x8F, 0x4F, 0x8D, 0x4D, 0x4C, 0x8C,
-        0x44, 0x84, 0x85, 0x45, 0x87, 0x47, 0x46, 0x86, 0x82, 0x42, 0x43, 0x83, 0x41, 0x81, 0x80,
-        0x40]
-
-    # endregion  Calculate CRC
-
-    def __init__(self, deviceName, portName, baud, addrLis, callback_method):
+    def __init__(self, deviceName, portName, baud, addrLis, callback_method, debug=False):
         print("Initializing device model")
         # Device name (customized)
         self.deviceName = deviceName
-        # Serial port number
-        self.serialConfig.portName = portName
-        # Baud rate
-        self.serialConfig.baud = baud
+        # Serial port configuration (serial port number and baud rate)
+        self.serialConfig = SerialConfig(portName, baud)
         # Modbus ID device address
         self.addrLis = addrLis
+        # Set of Modbus IDs for fast lookups while framing
+        self._addr_set = frozenset(addrLis)
+        # Device data dictionary
         self.deviceData = {}
+        # Receive buffer
+        self.TempBytes = bytearray()
+        # Start register
+        self.statReg = None
         # Data callback method
         self.callback_method = callback_method
+        # Print every received and transmitted frame
+        self.debug = debug
         # Initialize device data dictionary
         for addr in addrLis:
             self.deviceData[addr] = {}
 
     # Get CRC check
     def get_crc(self, datas, dlen):
-        tempH = 0xff  # High CRC byte initialization
-        tempL = 0xff  # Low CRC byte initialization
-        for i in range(0, dlen):
-            tempIndex = (tempH ^ datas[i]) & 0xff
-            tempH = (tempL ^ self.auchCRCHi[tempIndex]) & 0xff
-            tempL = self.auchCRCLo[tempIndex]
-        return (tempH << 8) | tempL
-        pass
+        crc = _modbus_crc(bytes(datas[:dlen]))
+        # High byte of the result is the first CRC byte on the wire
+        return ((crc & 0xff) << 8) | (crc >> 8)
 
     # region Obtain device data
 
@@ -163,20 +192,16 @@ class DeviceModel:
     # Listening to serial data threads
     def readDataTh(self, threadName, delay):
         print("Starting " + threadName)
-        while True:
-            # If the serial port is open
-            if self.isOpen:
-                try:
-                    tLen = self.serialPort.inWaiting()
-                    if tLen > 0:
-                        data = self.serialPort.read(tLen)
-                        self.onDataReceived(data)
-                except Exception as ex:
-                    print(ex)
-            else:
-                time.sleep(0.1)
-                print("Serial port is not open")
-                break
+        # While the serial port is open
+        while self.isOpen:
+            try:
+                # Block until the first byte arrives (or the port timeout expires), then drain the rest
+                data = self.serialPort.read(1)
+                if data:
+                    self.onDataReceived(data + self.serialPort.read_all())
+            except Exception as ex:
+                print(ex)
+        print("Serial port is not open")
 
     # Close device
     def closeDevice(self):
@@ -190,95 +215,87 @@ class DeviceModel:
 
     # Serial port data processing
     def onDataReceived(self, data):
-        
-        hex_data = ' '.join(format(byte, '02X') for byte in data)
-        print(f"Received data: {hex_data}")
-        tempdata = bytes.fromhex(data.hex())
-        for val in tempdata:
-            self.TempBytes.append(val)
+        if self.debug:
+            print(f"Received data: {data.hex(' ').upper()}")
+        # Bind hot attributes to locals for the scan
+        buf = self.TempBytes
+        addrs = self._addr_set
+        get_crc = self.get_crc
+        buf.extend(data)
+        n = len(buf)
+        # Read index, the buffer is only compacted once after the scan
+        i = 0
+        while i < n:
             # Determine if the ID is correct
-            if self.TempBytes[0] not in self.addrLis:
-                del self.TempBytes[0]
+            if buf[i] not in addrs:
+                i += 1
                 continue
+            if n - i < 3:
+                break
             # Determine whether it is 03 to read the function code
-            if len(self.TempBytes) > 2:
-                if not (self.TempBytes[1] == 0x03):
-                    del self.TempBytes[0]
-                    continue
-                tLen = len(self.TempBytes)
-                # Get a complete package of protocol data
-                if tLen == self.TempBytes[2] + 5:
-                    # CRC check
-                    tempCrc = self.get_crc(self.TempBytes, tLen - 2)
-                    if (tempCrc >> 8) == self.TempBytes[tLen - 2] and (tempCrc & 0xff) == self.TempBytes[tLen - 1]:
-                        self.processData(self.TempBytes[2])
-                    else:
-                        del self.TempBytes[0]
+            if buf[i + 1] != 0x03:
+                i += 1
+                continue
+            tLen = buf[i + 2] + 5
+            # Wait for a complete package of protocol data
+            if n - i < tLen:
+                break
+            # CRC check
+            tempCrc = get_crc(buf[i:i + tLen - 2], tLen - 2)
+            if (tempCrc >> 8) == buf[i + tLen - 2] and (tempCrc & 0xff) == buf[i + tLen - 1]:
+                self.processData(buf[i + 2], i)
+                i += tLen
+            else:
+                i += 1
+        # Drop the consumed bytes, keeping any incomplete package
+        if i:
+            del buf[:i]
 
     # Data analysis
-    def processData(self, length):
-        # Data parsing
-        ADDR = self.TempBytes[0]
+    def processData(self, length, offset=0):
+        # Data parsing, the package starts at offset in the receive buffer
+        buf = self.TempBytes
+        ADDR = buf[offset]
+        data = self.deviceData[ADDR]
         if length == 24:
-            AccX = self.getSignInt16(self.TempBytes[3] << 8 | self.TempBytes[4]) / 32768 * 16
-            AccY = self.getSignInt16(self.TempBytes[5] << 8 | self.TempBytes[6]) / 32768 * 16
-            AccZ = self.getSignInt16(self.TempBytes[7] << 8 | self.TempBytes[8]) / 32768 * 16
-            self.set(ADDR, "AccX", round(AccX, 3))
-            self.set(ADDR, "AccY", round(AccY, 3))
-            self.set(ADDR, "AccZ", round(AccZ, 3))
-
-            AsX = self.getSignInt16(self.TempBytes[9] << 8 | self.TempBytes[10]) / 32768 * 2000
-            AsY = self.getSignInt16(self.TempBytes[11] << 8 | self.TempBytes[12]) / 32768 * 2000
-            AsZ = self.getSignInt16(self.TempBytes[13] << 8 | self.TempBytes[14]) / 32768 * 2000
-            self.set(ADDR, "AsX", round(AsX, 3))
-            self.set(ADDR, "AsY", round(AsY, 3))
-            self.set(ADDR, "AsZ", round(AsZ, 3))
-
-            HX = self.getSignInt16(self.TempBytes[15] << 8 | self.TempBytes[16]) * 13 / 1000
-            HY = self.getSignInt16(self.TempBytes[17] << 8 | self.TempBytes[18]) * 13 / 1000
-            HZ = self.getSignInt16(self.TempBytes[19] << 8 | self.TempBytes[20]) * 13 / 1000
-            self.set(ADDR, "HX", round(HX, 3))
-            self.set(ADDR, "HY", round(HY, 3))
-            self.set(ADDR, "HZ", round(HZ, 3))
-
-            AngX = self.getSignInt16(self.TempBytes[21] << 8 | self.TempBytes[22]) / 32768 * 180
-            AngY = self.getSignInt16(self.TempBytes[23] << 8 | self.TempBytes[24]) / 32768 * 180
-            AngZ = self.getSignInt16(self.TempBytes[25] << 8 | self.TempBytes[26]) / 32768 * 180
-            self.set(ADDR, "AngX", round(AngX, 3))
-            self.set(ADDR, "AngY", round(AngY, 3))
-            self.set(ADDR, "AngZ", round(AngZ, 3))
-            self.callback_method(self)
+            # Acc, As, H and Ang for X/Y/Z, unpacked in place from the receive buffer
+            raw = _FRAME24.unpack_from(buf, offset)
+            vals = [round(value * scale, 3) for value, scale in zip(raw, _SCALE24)]
+            # Save all values of the block in one dictionary merge
+            data.update(zip(_KEYS24, vals))
+            # Only the new values are passed, subscribers format them if needed
+            self.callback_method(ADDR, SensorData._make(vals))
         else:
             if self.statReg is not None:
+                getSignInt16 = self.getSignInt16
+                setitem = data.__setitem__
+                statReg = self.statReg
                 for i in range(int(length / 2)):
-                    value = self.getSignInt16(self.TempBytes[2 * i + 3] << 8 | self.TempBytes[2 * i + 4])
+                    value = getSignInt16(buf[offset + 2 * i + 3] << 8 | buf[offset + 2 * i + 4])
                     value = value / 32768
-                    self.set(ADDR, str(self.statReg), round(value, 3))
-                    self.statReg += 1
-        self.TempBytes.clear()
+                    setitem(str(statReg), round(value, 3))
+                    statReg += 1
+                self.statReg = statReg
 
     # endregion
 
     @staticmethod
     def getSignInt16(num):
-        if num >= pow(2, 15):
-            num -= pow(2, 16)
-        return num
+        return num - 0x10000 if num >= 0x8000 else num
 
     @staticmethod
     def getSignInt32(num):
-        if num >= pow(2, 31):
-            num -= pow(2, 32)
-        return num
+        return num - 0x100000000 if num >= 0x80000000 else num
 
     # Sending serial port data
     def sendData(self, data):
         try:
-            hex_data = ' '.join(format(byte, '02X') for byte in data)
-            print(f"Transmitting data: {hex_data}")
             self.serialPort.write(data)
         except Exception as ex:
             print(ex)
+        if self.debug:
+            # bytes() also accepts the list of ints older callers pass
+            print(f"Transmitting data: {bytes(data).hex(' ').upper()}")
 
     # Read register
     def readReg(self, ADDR, regAddr, regCount):
@@ -302,56 +319,25 @@ class DeviceModel:
 
     # Send read instruction encapsulation
     def get_readBytes(self, devid, regAddr, regCount):
-        # Initialization
-        tempBytes = [None] * 8
-        # Device modbus address
-        tempBytes[0] = devid
-        # Read function code
-        tempBytes[1] = 0x03
-        # High 8 bits of register
-        tempBytes[2] = regAddr >> 8
-        # Low 8 bits of register
-        tempBytes[3] = regAddr & 0xff
-        # High 8 bits of register count
-        tempBytes[4] = regCount >> 8
-        # Low 8 bits of register count
-        tempBytes[5] = regCount & 0xff
-        # Get CRC check
-        tempCrc = self.get_crc(tempBytes, len(tempBytes) - 2)
-        # High 8 bits of CRC check
-        tempBytes[6] = tempCrc >> 8
-        # Low 8 bits of CRC check
-        tempBytes[7] = tempCrc & 0xff
-        return tempBytes
+        # Device modbus address, read function code, register and register count (high 8 bits first)
+        head = struct.pack('>BBHH', devid, 0x03, regAddr, regCount)
+        # CRC check, low 8 bits first on the wire
+        return head + struct.pack('<H', _modbus_crc(head))
 
     # Send write instruction encapsulation
     def get_writeBytes(self, devid, regAddr, sValue):
-        # Initialization
-        tempBytes = [None] * 8
-        # Device modbus address
-        tempBytes[0] = devid
-        # Write function code
-        tempBytes[1] = 0x06
-        # High 8 bits of register
-        tempBytes[2] = regAddr >> 8
-        # Low 8 bits of register
-        tempBytes[3] = regAddr & 0xff
-        # High 8 bits of register value
-        tempBytes[4] = sValue >> 8
-        # Low 8 bits of register value
-        tempBytes[5] = sValue & 0xff
-        # Get CRC check
-        tempCrc = self.get_crc(tempBytes, len(tempBytes) - 2)
-        # High 8 bits of CRC check
-        tempBytes[6] = tempCrc >> 8
-        # Low 8 bits of CRC check
-        tempBytes[7] = tempCrc & 0xff
-        return tempBytes
+        # Device modbus address, write function code, register and register value (high 8 bits first)
+        head = struct.pack('>BBHH', devid, 0x06, regAddr, sValue)
+        # CRC check, low 8 bits first on the wire
+        return head + struct.pack('<H', _modbus_crc(head))
 
     # Start loop reading
     def startLoopRead(self):
         # Loop read control
         self.loop = True
+        # Encapsulate the read instructions once, they are the same for every iteration
+        self._poll_statReg = 0x34
+        self._poll_cmds = {addr: self.get_readBytes(addr, self._poll_statReg, 12) for addr in self.addrLis}
         # Enable read thread
         t = threading.Thread(target=self.loopRead, args=())
         t.start()
@@ -359,10 +345,27 @@ class DeviceModel:
     # Loop reading thread
     def loopRead(self):
         print("Loop reading started")
+        # Request period per device, paced against a deadline so write time and jitter do not accumulate
+        period = 0.2
+        next_t = time.monotonic()
         while self.loop:
             for addr in self.addrLis:
-                self.readReg(addr, 0x34, 12) 
-                time.sleep(0.2)
+                # Start register (used for handling returned data)
+                self.statReg = self._poll_statReg
+                cmd = self._poll_cmds[addr]
+                try:
+                    self.serialPort.write(cmd)
+                except Exception as ex:
+                    print(ex)
+                if self.debug:
+                    print(f"Transmitting data: {cmd.hex(' ').upper()}")
+                next_t += period
+                delay = next_t - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    # Fell behind, restart the schedule instead of bursting requests
+                    next_t = time.monotonic()
         print("Loop reading ended")
 
     # Stop loop reading
@@ -1,12 +1,21 @@
 import device_model
 import time
 
+# Minimum interval between two printed updates (seconds)
+PRINT_INTERVAL = 1.0
+lastPrint = 0.0
+
 
 # Data update event
-def updateData(DeviceModel):
-    print(DeviceModel.deviceData)
+def updateData(ADDR, data):
+    global lastPrint
+    # Throttle printing, formatting every frame is costly at high data rates
+    now = time.monotonic()
+    if now - lastPrint >= PRINT_INTERVAL:
+        lastPrint = now
+        print(ADDR, data)
     # Get the value of acceleration X
-    # print(DeviceModel.get("AccX"))
+    # print(data.AccX)
 
 
 if __name__ == "__main__":
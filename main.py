@@ -8,6 +8,9 @@ import time
 import argparse
 from datetime import datetime
 import sys
+import queue
+import threading
+import numpy as np
 import matplotlib.pyplot as plt
 
 plt.ion()  # Enable interactive mode for dynamic updating
@@ -15,15 +18,18 @@ plt.ion()  # Enable interactive mode for dynamic updating
 # Global flag to track if the window is closed
 program_running = True
 
+# Acceleration scale factor (+/-16 g full scale over a signed 16-bit range)
+_ACC_SCALE = 16 / 32768
+
 # Function to handle the window close event
 def on_close(event):
     global program_running
     print(f"{get_timestamp()} - Plot window closed. Exiting program.")
     program_running = False
 
-# Function to get the current timestamp with milliseconds
-def get_timestamp():
-    now = datetime.now()
+# Function to get the current (or the given epoch) timestamp with milliseconds
+def get_timestamp(timestamp=None):
+    now = datetime.now() if timestamp is None else datetime.fromtimestamp(timestamp)
     return now.strftime('%H:%M:%S') + f'.{now.microsecond // 1000:03d}'
 
 # Function to decode the RX message
@@ -32,22 +38,14 @@ def decode_vibration_data(data):
         print(f"Invalid data length: {len(data)}. Expected 29 bytes.")
         return None
 
-    AXH, AXL, AYH, AYL, AZH, AZL = data[3:9]
-
-    AX = (AXH << 8) | AXL
-    AY = (AYH << 8) | AYL
-    AZ = (AZH << 8) | AZL
+    # AX, AY, AZ are big-endian signed shorts right after the 3-byte header
+    AX, AY, AZ = struct.unpack_from('>3h', data, 3)
 
-    AX = struct.unpack('h', struct.pack('H', AX))[0]
-    AY = struct.unpack('h', struct.pack('H', AY))[0]
-    AZ = struct.unpack('h', struct.pack('H', AZ))[0]
+    AX_corrected = AX * _ACC_SCALE
+    AY_corrected = AY * _ACC_SCALE
+    AZ_corrected = AZ * _ACC_SCALE
 
-    AX_corrected = AX / 32768 * 16
-    AY_corrected = AY / 32768 * 16
-    AZ_corrected = AZ / 32768 * 16
-
-    CRCH, CRCL = data[-2], data[-1]
-    CRC = (CRCH << 8) | CRCL
+    CRC = struct.unpack_from('>H', data, len(data) - 2)[0]
 
     return AX_corrected, AY_corrected, AZ_corrected, CRC
 
@@ -82,49 +80,58 @@ def parse_arguments():
     
     return args
 
-# Function to read exactly 29 bytes from the serial port (with timeout)
-def read_exact_message(ser, expected_length=29, timeout=0.1):
-    buffer = b''
-    start_time = time.time()
+# Function to read exactly 29 bytes from the serial port (bounded by the port timeout)
+def read_exact_message(ser, expected_length=29):
+    # One blocking read returns as soon as the whole response has arrived
+    buffer = ser.read(expected_length)
 
-    while len(buffer) < expected_length:
-        byte = ser.read(1)
-        if byte:
-            buffer += byte
-            start_time = time.time()
-        else:
-            if time.time() - start_time > timeout:
-                break
+    # Top up a response that was split by the timeout
+    if 0 < len(buffer) < expected_length:
+        buffer += ser.read(expected_length - len(buffer))
 
     return buffer
 
-# Function to track and maintain min/max values of AX, AY, AZ and timestamps
-def track_min_max(ax_list, ay_list, az_list, timestamp_list, ax, ay, az):
-    current_timestamp = get_timestamp()
-    
-    ax_list.append(ax)
-    ay_list.append(ay)
-    az_list.append(az)
-    timestamp_list.append(current_timestamp)
-
-    ax_min = min(ax_list)
-    ax_max = max(ax_list)
-    ax_min_time = timestamp_list[ax_list.index(ax_min)]
-    ax_max_time = timestamp_list[ax_list.index(ax_max)]
-
-    ay_min = min(ay_list)
-    ay_max = max(ay_list)
-    ay_min_time = timestamp_list[ay_list.index(ay_min)]
-    ay_max_time = timestamp_list[ay_list.index(ay_max)]
-
-    az_min = min(az_list)
-    az_max = max(az_list)
-    az_min_time = timestamp_list[az_list.index(az_min)]
-    az_max_time = timestamp_list[az_list.index(az_max)]
-
-    return (ax_min, ax_max, ax_min_time, ax_max_time,
-            ay_min, ay_max, ay_min_time, ay_max_time,
-            az_min, az_max, az_min_time, az_max_time)
+# Function to poll the device and queue the decoded samples (runs in the reader thread)
+def read_samples(ser, data_to_send, hex_string, samples, debug):
+    try:
+        while program_running:
+            ser.write(data_to_send)
+
+            if debug:
+                print(f"{get_timestamp()} - TX: {hex_string}")
+
+            response = read_exact_message(ser, expected_length=29)
+            response_len = len(response)
+
+            if response_len == 29:
+                if debug:
+                    response_hex = response.hex()
+                    print(f"{get_timestamp()} - RX: {response_len} - {response_hex}")
+
+                # Decode the vibration data and hand it to the main thread with its timestamp
+                AX_corrected, AY_corrected, AZ_corrected, CRC = decode_vibration_data(response)
+                samples.put((AX_corrected, AY_corrected, AZ_corrected, CRC, time.time()))
+
+            else:
+                print(f"{get_timestamp()} - Invalid response length: {response_len}. Expected 29 bytes.")
+
+    except Exception as e:
+        # Hand the failure to the main thread, which re-raises it
+        samples.put(e)
+
+# Function to compute min/max values of AX, AY, AZ and their timestamps over the first `count` samples
+def batch_min_max(ax_arr, ay_arr, az_arr, ts_arr, count):
+    result = []
+    for arr in (ax_arr, ay_arr, az_arr):
+        values = arr[:count]
+        # argmin/argmax return the first occurrence on ties
+        min_idx = values.argmin()
+        max_idx = values.argmax()
+        result += [float(values[min_idx]), float(values[max_idx]),
+                   get_timestamp(ts_arr[min_idx]), get_timestamp(ts_arr[max_idx])]
+
+    # (min, max, min_time, max_time) for AX, then AY, then AZ
+    return tuple(result)
 
 # Function to plot and update the min/max values in the same window
 def plot_min_max(ax_min, ax_max, ay_min, ay_max, az_min, az_max, line_value=None):
@@ -182,9 +189,12 @@ def main():
         show_live = args.live  # Show live decoded data if --live is used
         plot_data = args.plot  # Plot data if --plot is used
 
-        # Lists to store the values of AX, AY, AZ, and timestamps
-        ax_list, ay_list, az_list, timestamp_list = [], [], [], []
-        message_count = 0  # Counter to track the number of messages processed
+        # Preallocated buffers for the AX, AY, AZ values and epoch timestamps of the current batch
+        ax_arr = np.empty(max_messages, np.float32)
+        ay_arr = np.empty(max_messages, np.float32)
+        az_arr = np.empty(max_messages, np.float32)
+        ts_arr = np.empty(max_messages, np.float64)
+        message_count = 0  # Counter to track the number of messages processed, also the write index
 
         # Set up the close event handler to detect when the plot window is closed
         fig = plt.figure()
@@ -194,7 +204,7 @@ def main():
             ser = serial.Serial(
                 port=port,
                 baudrate=baudrate,
-                timeout=0.05  # Reduced timeout for faster operation
+                timeout=0.1  # Upper bound for a whole response, read() returns as soon as it is complete
             )
 
             if ser.is_open:
@@ -203,58 +213,60 @@ def main():
             hex_string = '50030034000C0980'  # Example command to request data
             data_to_send = binascii.unhexlify(hex_string)
 
+            # Decoded samples from the reader thread
+            samples = queue.SimpleQueue()
+            reader_thread = threading.Thread(target=read_samples, args=(ser, data_to_send, hex_string, samples, debug), daemon=True)
+
             try:
                 print(f"{get_timestamp()} - Running. Use Ctrl+C to stop the program.")
+                reader_thread.start()
 
                 while program_running:  # Keep running until the window is closed
-                    ser.write(data_to_send)
+                    try:
+                        sample = samples.get(timeout=0.05)
+                    except queue.Empty:
+                        # Keep the plot window responsive while waiting for data
+                        plt.pause(0.001)
+                        continue
 
-                    if debug:
-                        print(f"{get_timestamp()} - TX: {hex_string}")
+                    # The reader thread stopped on an error
+                    if isinstance(sample, Exception):
+                        raise sample
 
-                    response = read_exact_message(ser, expected_length=29)
-                    response_len = len(response)
+                    AX_corrected, AY_corrected, AZ_corrected, CRC, timestamp = sample
 
-                    if response_len == 29:
-                        if debug:
-                            response_hex = binascii.hexlify(response).decode('utf-8')
-                            print(f"{get_timestamp()} - RX: {response_len} - {response_hex}")
+                    # Show live decoded data if --live is used
+                    if show_live:
+                        print(f"{get_timestamp(timestamp)} - AX: {AX_corrected:.3f}, AY: {AY_corrected:.3f}, AZ: {AZ_corrected:.3f}, CRC: {CRC}")
 
-                        # Decode the vibration data
-                        AX_corrected, AY_corrected, AZ_corrected, CRC = decode_vibration_data(response)
+                    # Store the values and timestamp in the buffers, and increment the message counter
+                    ax_arr[message_count] = AX_corrected
+                    ay_arr[message_count] = AY_corrected
+                    az_arr[message_count] = AZ_corrected
+                    ts_arr[message_count] = timestamp
 
-                        # Show live decoded data if --live is used
-                        if show_live:
-                            print(f"{get_timestamp()} - AX: {AX_corrected:.3f}, AY: {AY_corrected:.3f}, AZ: {AZ_corrected:.3f}, CRC: {CRC}")
+                    message_count += 1
 
-                        # Add the values and timestamp to the lists, and increment the message counter
+                    # Show min/max values after processing `max_messages` number of messages
+                    if message_count == max_messages:
                         (ax_min, ax_max, ax_min_time, ax_max_time,
                          ay_min, ay_max, ay_min_time, ay_max_time,
-                         az_min, az_max, az_min_time, az_max_time) = track_min_max(ax_list, ay_list, az_list, timestamp_list, AX_corrected, AY_corrected, AZ_corrected)
-
-                        message_count += 1
-
-                        # Show min/max values after processing `max_messages` number of messages
-                        if message_count == max_messages:
-                            print(f"{get_timestamp()} - Min/Max AX: {ax_min:.3f} / {ax_max:.3f}  |  AY: {ay_min:.3f} / {ay_max:.3f}  |  AZ: {az_min:.3f} / {az_max:.3f}")
-                            message_count = 0  # Reset the counter
-                            
-                            # Plot the data if --plot is used
-                            if plot_data:
-                                plot_min_max(ax_min, ax_max, ay_min, ay_max, az_min, az_max, line_value=args.line)
-                            # Reset the lists to clear previous values for the next batch
-                            ax_list.clear()
-                            ay_list.clear()
-                            az_list.clear()
-                            timestamp_list.clear()
-
-                    else:
-                        print(f"{get_timestamp()} - Invalid response length: {response_len}. Expected 29 bytes.")
+                         az_min, az_max, az_min_time, az_max_time) = batch_min_max(ax_arr, ay_arr, az_arr, ts_arr, message_count)
+                        print(f"{get_timestamp()} - Min/Max AX: {ax_min:.3f} / {ax_max:.3f}  |  AY: {ay_min:.3f} / {ay_max:.3f}  |  AZ: {az_min:.3f} / {az_max:.3f}")
+                        message_count = 0  # Reset the counter, the buffers are overwritten by the next batch
+
+                        # Plot the data if --plot is used
+                        if plot_data:
+                            plot_min_max(ax_min, ax_max, ay_min, ay_max, az_min, az_max, line_value=args.line)
 
             except KeyboardInterrupt:
                 print(f"{get_timestamp()} - Program interrupted with Ctrl+C, exiting...")
 
             finally:
+                # Stop the reader thread before closing the port it is using
+                program_running = False
+                if reader_thread.is_alive():
+                    reader_thread.join()
                 if ser.is_open:
                     ser.close()
                     print(f"{get_timestamp()} - Serial port {ser.name} is closed.")